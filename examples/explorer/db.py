@@ -8,28 +8,110 @@ import streamlit as st
 
 logger = logging.getLogger(__name__)
 
+# Temp-table cache per agent_data table function, pre-unioned across both
+# sources. Scanning the JSONL files once and querying native DuckDB
+# storage afterwards is far cheaper than re-scanning on every query.
+CACHE_TABLES = {
+    "read_conversations": "conv_cache",
+    "read_plans": "plan_cache",
+    "read_todos": "todo_cache",
+    "read_history": "history_cache",
+    "read_stats": "stats_cache",
+}
 
-def get_connection() -> duckdb.DuckDBPyConnection:
-    """Return a cached DuckDB connection with the agent_data extension loaded.
-    
-    Re-creates the connection if the existing one is stale (e.g. after browser refresh).
-    """
-    con = st.session_state.get("duckdb_con")
-    if con is not None:
+
+def _ensure_cache_tables(con: duckdb.DuckDBPyConnection) -> None:
+    """Materialize each table function into a temp table (both sources)."""
+    claude, copilot = get_data_paths()
+    for func, table in CACHE_TABLES.items():
         try:
-            con.execute("SELECT 1")
-            return con
-        except Exception:
-            logger.warning("Stale DuckDB connection detected, reconnecting")
-            st.cache_data.clear()
-            st.session_state.pop("duckdb_con", None)
+            con.execute(f"""
+                CREATE TEMP TABLE IF NOT EXISTS {table} AS
+                SELECT * FROM {func}(path='{claude}')
+                UNION ALL
+                SELECT * FROM {func}(path='{copilot}')
+            """)
+        except Exception as e:
+            logger.warning("Could not materialize %s from %s: %s", table, func, e)
+    _create_cache_indexes(con)
+
+
+# Frequently filtered/joined columns per cache table. session_id drives
+# the sample join queries; the others back the common WHERE predicates.
+_CACHE_INDEXES = {
+    "conv_cache": ["source", "session_id", "message_type", "tool_name"],
+    "todo_cache": ["session_id"],
+    "history_cache": ["session_id"],
+}
+
+
+def _create_cache_indexes(con: duckdb.DuckDBPyConnection) -> None:
+    """Index the cache tables so selective filters and joins skip full scans."""
+    for table, columns in _CACHE_INDEXES.items():
+        for col in columns:
+            try:
+                con.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_{col} ON {table}({col})"
+                )
+            except Exception as e:
+                logger.warning("Could not index %s(%s): %s", table, col, e)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _sources_fingerprint() -> float:
+    """Newest file mtime across both source trees.
+
+    Drives temp-table invalidation: when anything under ~/.claude or
+    ~/.copilot changes, the fingerprint moves and get_connection rebuilds
+    the caches. The short TTL keeps the walk off the per-rerun path.
+    """
+    newest = 0.0
+    for root in get_data_paths():
+        for dirpath, _dirs, files in os.walk(os.path.expanduser(root)):
+            for name in files:
+                try:
+                    newest = max(newest, os.stat(os.path.join(dirpath, name)).st_mtime)
+                except OSError:
+                    continue
+    return newest
+
+
+@st.cache_resource(show_spinner="Connecting to DuckDB…")
+def _connect() -> duckdb.DuckDBPyConnection:
+    """Open the process-wide DuckDB connection and materialize the caches."""
     con = duckdb.connect()
     con.execute("INSTALL agent_data FROM community")
     con.execute("LOAD agent_data")
-    st.session_state["duckdb_con"] = con
+    _ensure_cache_tables(con)
     return con
 
 
+# Fingerprint the temp tables were last built against; module globals
+# persist for the life of the Streamlit process, like the caches do.
+_cached_fingerprint: float | None = None
+
+
+def get_connection() -> duckdb.DuckDBPyConnection:
+    """Return the shared DuckDB connection, rebuilding stale caches.
+
+    cache_resource guarantees a single connection per process instead of
+    one per session-state entry, so it survives browser refreshes and is
+    shared across reruns without re-probing on every script run. The
+    source data is materialized into temp tables at connect time; when
+    the source trees' mtime fingerprint moves (or _safe_query clears the
+    resource cache), the connection is reopened and the tables rebuilt,
+    so cached pages never drift from ones scanning the JSONL live.
+    """
+    global _cached_fingerprint
+    fingerprint = _sources_fingerprint()
+    if _cached_fingerprint is not None and fingerprint != _cached_fingerprint:
+        _connect.clear()
+        st.cache_data.clear()
+    _cached_fingerprint = fingerprint
+    return _connect()
+
+
+@st.cache_data(ttl=60)
 def get_data_paths() -> tuple[str, str]:
     """Return (claude_path, copilot_path) from env vars or defaults."""
     claude = os.environ.get("AGENT_DATA_CLAUDE_PATH", "~/.claude")
@@ -37,10 +119,18 @@ def get_data_paths() -> tuple[str, str]:
     return claude, copilot
 
 
-def run_query(sql: str) -> pd.DataFrame:
-    """Execute a SQL query and return results as a DataFrame."""
+def run_query(sql: str, params: list | None = None) -> pd.DataFrame:
+    """Execute a SQL query and return results as a DataFrame.
+
+    When ``params`` is given, ``sql`` is a template with ``?`` placeholders
+    and is executed as a prepared statement — repeated runs of the same
+    template skip DuckDB's parse/bind/optimize phase.
+    """
     con = get_connection()
-    return con.execute(sql).df()
+    cur = con.execute(sql, params) if params else con.execute(sql)
+    # Scans over many small JSONL files yield many tiny Arrow batches;
+    # collapsing them first avoids per-batch overhead downstream.
+    return cur.fetch_arrow_table().combine_chunks().to_pandas()
 
 
 def _safe_query(sql: str) -> pd.DataFrame:
@@ -50,7 +140,7 @@ def _safe_query(sql: str) -> pd.DataFrame:
     except Exception as e:
         logger.warning("Query failed (%s), retrying with fresh connection", e)
         # Connection may be stale — force reconnect and clear cache
-        st.session_state.pop("duckdb_con", None)
+        _connect.clear()
         st.cache_data.clear()
         try:
             return run_query(sql)
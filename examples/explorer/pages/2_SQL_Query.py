@@ -8,7 +8,7 @@ import streamlit as st
 import sys, os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from db import get_connection, get_data_paths, run_query
+from db import CACHE_TABLES, get_connection, get_data_paths, run_query
 
 st.title("🔎 SQL Query")
 
@@ -20,17 +20,19 @@ claude_path, copilot_path = get_data_paths()
 # Helper: build path expression based on source choice
 # ---------------------------------------------------------------------------
 def _path_expr(source: str, table: str = "read_conversations") -> str:
-    """Return a FROM clause with path parameter based on source selection."""
+    """Return a FROM clause based on source selection.
+
+    Queries go against the per-connection temp-table caches (see
+    db.CACHE_TABLES) rather than re-scanning the JSONL sources through
+    the table functions on every run.
+    """
+    cache = CACHE_TABLES[table]
     if source == "Claude":
-        return f"{table}(path='{claude_path}')"
+        return f"(SELECT * FROM {cache} WHERE source = 'claude')"
     elif source == "Copilot":
-        return f"{table}(path='{copilot_path}')"
-    else:  # Both
-        return (
-            f"(\n    SELECT * FROM {table}(path='{claude_path}')\n"
-            f"    UNION ALL\n"
-            f"    SELECT * FROM {table}(path='{copilot_path}')\n)"
-        )
+        return f"(SELECT * FROM {cache} WHERE source = 'copilot')"
+    else:  # Both — cache tables are already unioned across sources
+        return cache
 
 
 # ---------------------------------------------------------------------------
@@ -238,13 +240,20 @@ if st.sidebar.button("Replace & Run", type="primary", use_container_width=True):
     cols = ", ".join(selected_columns) if selected_columns else "*"
     from_expr = _path_expr(sql_source, selected_table_name)
     built_sql = f"SELECT {cols}\nFROM {from_expr}"
+    params = []
     if where_clause:
+        # Arbitrary WHERE text can't be parameterized — stays on the slow path
         built_sql += f"\nWHERE {where_clause}"
     if order_by:
         built_sql += f"\nORDER BY {order_by}"
     if limit_val > 0:
-        built_sql += f"\nLIMIT {limit_val}"
-    st.session_state[EDITOR_KEY] = built_sql
+        built_sql += "\nLIMIT ?"
+        params.append(int(limit_val))
+    # The editor shows runnable SQL with literals; execution reuses the
+    # ?-template so structurally identical builder queries hit DuckDB's
+    # prepared-statement path instead of being re-planned.
+    st.session_state[EDITOR_KEY] = built_sql.replace("LIMIT ?", f"LIMIT {limit_val}")
+    st.session_state["builder_stmt"] = (built_sql, params)
     st.session_state["sql_auto_run"] = True
     st.rerun()
 
@@ -263,26 +272,74 @@ col1, col2 = st.columns([1, 5])
 with col1:
     run_btn = st.button("▶ Run", type="primary")
 
-should_run = run_btn or st.session_state.get("sql_auto_run", False)
+auto_run = st.session_state.get("sql_auto_run", False)
+should_run = run_btn or auto_run
 st.session_state["sql_auto_run"] = False
 
+# Parameterized template from the query builder; only valid for the
+# auto-run immediately following "Replace & Run" (manual edits invalidate it).
+builder_stmt = st.session_state.pop("builder_stmt", None)
+if not auto_run:
+    builder_stmt = None
+
+RESULT_PAGE_SIZE = 500
+
+
+def _to_csv_bytes(df) -> bytes:
+    """Encode a DataFrame as CSV using pyarrow's native writer.
+
+    pandas' to_csv formats cell-by-cell in Python; pyarrow (already a
+    Streamlit dependency) encodes columns in C++ and is typically an
+    order of magnitude faster on large mixed-type results.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        sink = pa.BufferOutputStream()
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), sink)
+        return sink.getvalue().to_pybytes()
+    except Exception:
+        return df.to_csv(index=False).encode("utf-8")
+
 if should_run and sql_input.strip():
     try:
         with st.spinner("Executing query..."):
-            result_df = run_query(sql_input)
-        st.success(f"✅ {len(result_df)} rows returned")
-        st.dataframe(result_df, use_container_width=True, hide_index=True)
-
-        csv = result_df.to_csv(index=False)
-        st.download_button(
-            "📥 Download CSV",
-            data=csv,
-            file_name="query_results.csv",
-            mime="text/csv",
-        )
+            if builder_stmt is not None:
+                st.session_state["sql_result_df"] = run_query(*builder_stmt)
+            else:
+                st.session_state["sql_result_df"] = run_query(sql_input)
     except Exception as e:
+        st.session_state.pop("sql_result_df", None)
         st.error(f"Query failed: {e}")
 
+result_df = st.session_state.get("sql_result_df")
+if result_df is not None:
+    st.success(f"✅ {len(result_df)} rows returned")
+
+    # Only ship the visible page to the browser — the full frame is
+    # serialized to Arrow on every rerun otherwise, which dominates
+    # latency for large results. The CSV download keeps all rows.
+    if len(result_df) > RESULT_PAGE_SIZE:
+        n_pages = -(-len(result_df) // RESULT_PAGE_SIZE)
+        page = st.number_input(
+            f"Page (of {n_pages}, {RESULT_PAGE_SIZE} rows each)",
+            min_value=1,
+            max_value=n_pages,
+            value=1,
+        )
+        view = result_df.iloc[(page - 1) * RESULT_PAGE_SIZE : page * RESULT_PAGE_SIZE]
+    else:
+        view = result_df
+    st.dataframe(view, use_container_width=True, hide_index=True)
+
+    st.download_button(
+        "📥 Download CSV",
+        data=_to_csv_bytes(result_df),
+        file_name="query_results.csv",
+        mime="text/csv",
+    )
+
 # ---------------------------------------------------------------------------
 # Quick reference
 # ---------------------------------------------------------------------------
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Analyze the on-disk structure of an agent data directory.
+
+Walks a Claude Code (~/.claude) or Copilot CLI (~/.copilot) data directory
+and prints a JSON summary of its layout: the known folders (projects/,
+plans/, todos/, file-history/), per-file metadata, and sampled JSON/JSONL
+record shapes. Useful for keeping docs/*_FILE_STRUCTURE.md and the serde
+types in src/types/ honest against real data layouts — without ever
+printing full conversation files (see .github/copilot-instructions.md).
+
+Usage:
+    python scripts/analyze_structure.py [path]    # default: ~/.claude
+"""
+
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+_HAS_FADVISE = hasattr(os, "posix_fadvise")  # absent on Windows/macOS
+
+# Pre-bound parser: the fastest available loads() is resolved once at
+# import, so the per-line hot loops pay no module attribute lookup.
+try:  # orjson parses sampled lines 2-5x faster and takes bytes directly
+    from orjson import loads as _loads
+except ImportError:
+    try:
+        from ujson import loads as _loads  # next-fastest drop-in
+    except ImportError:
+        _loads = json.loads  # also accepts bytes
+
+
+def _ext(name: str) -> str:
+    """File extension including the dot ('' if none) — plain str ops.
+
+    Per-entry Path construction just to read .suffix/.stem dominates
+    large traversals with object churn; rpartition avoids it.
+    """
+    head, sep, tail = name.rpartition(".")
+    return sep + tail if head else ""
+
+
+class FileInfo:
+    """Per-file metadata record.
+
+    A __slots__ class instead of a dict: the inner loops create one of
+    these per file, and slot storage skips the per-instance dict header
+    and key hashing. The dict shape only materializes at JSON output
+    time via _json_default.
+    """
+
+    __slots__ = ("name", "extension", "size_bytes", "error")
+
+    def __init__(self, name, extension="", size_bytes=0, error=None):
+        self.name = name
+        self.extension = extension
+        self.size_bytes = size_bytes
+        self.error = error
+
+    def to_dict(self) -> dict:
+        if self.error is not None:
+            return {"name": self.name, "error": self.error}
+        return {
+            "name": self.name,
+            "extension": self.extension,
+            "size_bytes": self.size_bytes,
+        }
+
+
+# Interned type names for the JSON-representable types; a dict hit is
+# cheaper than the type(v).__name__ attribute walk in the shape loops.
+_TYPE_NAMES = {
+    dict: "dict",
+    list: "list",
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    type(None): "NoneType",
+}
+
+
+def _shape(obj: dict, max_keys: int = 32) -> dict:
+    """Map the first max_keys keys of a record to their value type names."""
+    sample = {}
+    for k, v in obj.items():
+        if len(sample) >= max_keys:
+            break
+        sample[k] = _TYPE_NAMES.get(type(v)) or type(v).__name__
+    return sample
+
+
+def get_file_info(entry) -> FileInfo:
+    """Return name/extension/size metadata for a scandir entry."""
+    try:
+        # DirEntry caches the stat result gathered during the directory
+        # scan; follow_symlinks=False uses that cache instead of issuing
+        # a fresh stat(2) per file.
+        st = entry.stat(follow_symlinks=False)
+        return FileInfo(entry.name, _ext(entry.name), st.st_size)
+    except OSError as e:
+        # Rare: the entry vanished (or is unreadable) between the
+        # directory scan and the stat. Only then pay for an error record.
+        return FileInfo(entry.name, error=str(e))
+
+
+def analyze_jsonl_structure(filepath, max_lines=5, count_lines=True) -> dict:
+    """Sample the first max_lines records of a JSONL file.
+
+    With count_lines=False the scan stops as soon as the sample is
+    complete — O(max_lines) instead of O(file size) — and total_lines
+    only reflects the sampled head.
+    """
+    result = {
+        "total_lines": 0,
+        "sample_keys": set(),
+        "types_seen": set(),
+        "sample_objects": [],
+        "parse_errors": 0,
+    }
+    try:
+        with open(filepath, "rb") as f:
+            if _HAS_FADVISE:
+                # Hint aggressive readahead for the forward-only scan.
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            sampled = 0
+            while sampled < max_lines:
+                line = f.readline()
+                if not line:
+                    break
+                sampled += 1
+                result["total_lines"] = sampled
+                try:
+                    obj = _loads(line)
+                except ValueError:
+                    result["parse_errors"] += 1
+                    continue
+                if isinstance(obj, dict):
+                    # Bound accumulation so pathologically wide records
+                    # (or high-cardinality type fields) cost O(1), not
+                    # O(keys) per sampled line.
+                    if len(result["sample_keys"]) < 64:
+                        result["sample_keys"].update(obj.keys())
+                    if "type" in obj and len(result["types_seen"]) < 32:
+                        result["types_seen"].add(str(obj["type"]))
+                    if len(result["sample_objects"]) < 2:
+                        result["sample_objects"].append(_shape(obj))
+            if count_lines:
+                # Tail: count raw newlines in 1 MiB chunks — no UTF-8
+                # decode or per-line str allocation for the remainder.
+                tail_lines = 0
+                last_byte = b"\n"
+                while True:
+                    chunk = f.read(1 << 20)
+                    if not chunk:
+                        break
+                    tail_lines += chunk.count(b"\n")
+                    last_byte = chunk[-1:]
+                if last_byte != b"\n":
+                    tail_lines += 1  # unterminated final line still counts
+                result["total_lines"] = sampled + tail_lines
+            if _HAS_FADVISE:
+                # Drop our pages on the way out — a one-shot analysis
+                # pass shouldn't evict hotter data from the page cache.
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError as e:
+        result["error"] = str(e)
+    result["sample_keys"] = sorted(result["sample_keys"])
+    result["types_seen"] = sorted(result["types_seen"])
+    return result
+
+
+def analyze_json_structure(filepath, max_size=50000) -> dict:
+    """Describe the top-level shape of a small JSON file."""
+    result = {}
+    try:
+        with open(filepath, "rb") as f:
+            # fstat gate first: oversized files are never slurped at all.
+            size = os.fstat(f.fileno()).st_size
+            result["size_bytes"] = size
+            if size > max_size:
+                result["skipped"] = "file too large to sample"
+                return result
+            # Gated files are at most max_size bytes, so a single read
+            # is one small allocation; mmap would buy nothing here since
+            # the parser needs a contiguous bytes object anyway.
+            content = f.read()
+        obj = _loads(content)
+        result["top_level_type"] = type(obj).__name__
+        if isinstance(obj, dict):
+            result["keys"] = {k: type(v).__name__ for k, v in obj.items()}
+        elif isinstance(obj, list):
+            result["length"] = len(obj)
+            if obj and isinstance(obj[0], dict):
+                result["item_keys"] = {k: type(v).__name__ for k, v in obj[0].items()}
+    except (OSError, ValueError) as e:
+        result["error"] = str(e)
+    return result
+
+
+def analyze_projects_folder(path) -> dict:
+    """Per-project file inventory plus one sampled conversation."""
+    info = {"project_count": 0, "file_patterns": Counter(), "projects": {}}
+    sampled = False
+    with os.scandir(path) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            info["project_count"] += 1
+            project_info = {"files": [], "conversation_count": 0, "agent_count": 0}
+            first_conv = None
+            with os.scandir(entry.path) as files:
+                for f in files:
+                    project_info["files"].append(get_file_info(f))
+                    suffix = _ext(f.name)
+                    info["file_patterns"][suffix] += 1
+                    if suffix == ".jsonl":
+                        if f.name.startswith("agent-"):
+                            project_info["agent_count"] += 1
+                        else:
+                            project_info["conversation_count"] += 1
+                            if first_conv is None:
+                                first_conv = f.path
+            if not sampled and first_conv is not None:
+                # Sample the first regular conversation found; shape
+                # sampling only — skip the exact line count.
+                project_info["sample_conversation_structure"] = (
+                    analyze_jsonl_structure(first_conv, max_lines=10, count_lines=False)
+                )
+                sampled = True
+            info["projects"][entry.name] = project_info
+    info["file_patterns"] = dict(info["file_patterns"])
+    return info
+
+
+def analyze_plans_folder(path) -> dict:
+    """Inventory of plan markdown files."""
+    info = {"plan_count": 0, "total_bytes": 0, "files": []}
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(".md"):
+                file_info = get_file_info(entry)
+                info["plan_count"] += 1
+                info["total_bytes"] += file_info.size_bytes
+                info["files"].append(file_info)
+    return info
+
+
+def analyze_todos_folder(path, max_samples=3) -> dict:
+    """Count todo JSON files and sample a few of their shapes."""
+    info = {"todo_count": 0, "agent_scoped": 0, "samples": {}}
+    with os.scandir(path) as it:
+        for entry in it:
+            if not (entry.is_file() and entry.name.endswith(".json")):
+                continue
+            info["todo_count"] += 1
+            if "-agent-" in entry.name:
+                info["agent_scoped"] += 1
+            if len(info["samples"]) < max_samples:
+                info["samples"][entry.name] = analyze_json_structure(entry.path)
+    return info
+
+
+def analyze_file_history_folder(path) -> dict:
+    """Per-session backup counts for the file-history folder."""
+    info = {"session_count": 0, "total_backups": 0, "sessions": {}}
+    with os.scandir(path) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            info["session_count"] += 1
+            # Stream the count and first-5 sample — O(1) memory even for
+            # sessions with thousands of backups.
+            backup_count = 0
+            sample_files = []
+            with os.scandir(entry.path) as files:
+                for f in files:
+                    backup_count += 1
+                    if len(sample_files) < 5:
+                        sample_files.append(f.name)
+            info["total_backups"] += backup_count
+            info["sessions"][entry.name] = {
+                "backup_count": backup_count,
+                "sample_files": sample_files,
+            }
+    return info
+
+
+# Extension dispatch for sampled root files — one dict probe instead of
+# an if/elif chain re-comparing the suffix per entry.
+EXT_DISPATCH = {
+    ".jsonl": analyze_jsonl_structure,
+    ".json": analyze_json_structure,
+}
+
+# Folders with specialized analyzers; everything else is summarized generically.
+KNOWN_FOLDERS = {
+    "projects": ("projects", analyze_projects_folder),
+    "plans": ("plans", analyze_plans_folder),
+    "todos": ("todos", analyze_todos_folder),
+    "file-history": ("file_history", analyze_file_history_folder),
+}
+
+
+def walk_tree(root, max_depth=2, prune=None):
+    """Depth-limited BFS over scandir entries.
+
+    Yields (depth, parent_name, entry) tuples from a single traversal so
+    callers can categorize everything in one pass instead of re-entering
+    each subtree. ``prune(depth, name)`` skips descent into a directory.
+    """
+    queue = [(0, os.path.basename(os.fspath(root)), os.fspath(root))]
+    while queue:
+        depth, parent_name, path = queue.pop(0)
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    yield depth, parent_name, entry
+                    if (
+                        depth + 1 < max_depth
+                        and entry.is_dir()
+                        and not (prune and prune(depth, entry.name))
+                    ):
+                        queue.append((depth + 1, entry.name, entry.path))
+        except OSError:
+            continue
+
+
+def analyze_directory(root) -> dict:
+    """Analyze the root of an agent data directory."""
+    structure = {
+        "root": os.fspath(root),
+        "root_files": {},
+        "other_folders": {},
+        "statistics": Counter(),
+    }
+    # Single fused metadata pass: one BFS covers the root entries and the
+    # contents of unrecognized folders, with content sampling deferred
+    # into one batch. Known folders are pruned here — their specialized
+    # analyzers consume them — so no subtree is read twice.
+    sample_tasks = []
+    known_dirs = []
+    other_folders = structure["other_folders"]
+    for depth, parent_name, item in walk_tree(
+        root, max_depth=2, prune=lambda depth, name: depth == 0 and name in KNOWN_FOLDERS
+    ):
+        if depth == 0:
+            if item.is_dir():
+                structure["statistics"]["directories"] += 1
+                if item.name in KNOWN_FOLDERS:
+                    known_dirs.append((item.name, item.path))
+                else:
+                    other_folders[item.name] = {"entry_count": 0, "sample_entries": []}
+            elif item.is_file():
+                structure["statistics"]["files"] += 1
+                analyzer = EXT_DISPATCH.get(_ext(item.name))
+                if analyzer is not None:
+                    sample_tasks.append((item.name, analyzer, item.path))
+                else:
+                    structure["root_files"][item.name] = get_file_info(item)
+        else:
+            # Depth-1 entry inside an unrecognized folder
+            info = other_folders[parent_name]
+            info["entry_count"] += 1
+            if len(info["sample_entries"]) < 5:
+                info["sample_entries"].append(item.name)
+    for name, dir_path in known_dirs:
+        key, analyzer = KNOWN_FOLDERS[name]
+        structure[key] = analyzer(dir_path)
+    if sample_tasks:
+        # Sampling is I/O-bound and the GIL is released during reads, so
+        # threads overlap the per-file opens/reads on a cold cache.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+            results = ex.map(lambda t: t[1](t[2]), sample_tasks)
+            for (name, _, _), result in zip(sample_tasks, results):
+                structure["root_files"][name] = result
+    structure["statistics"] = dict(structure["statistics"])
+    return structure
+
+
+def _json_default(obj):
+    """Serialize FileInfo records (and anything else str-able) lazily."""
+    if isinstance(obj, FileInfo):
+        return obj.to_dict()
+    return str(obj)
+
+
+def main():
+    path = Path(sys.argv[1] if len(sys.argv) > 1 else "~/.claude").expanduser()
+    if not path.is_dir():
+        print(f"error: {path} is not a directory", file=sys.stderr)
+        sys.exit(1)
+    structure = analyze_directory(path)
+    # Stream straight to stdout rather than building the whole
+    # pretty-printed report as one giant intermediate string.
+    json.dump(structure, sys.stdout, indent=2, default=_json_default)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,36 +7,122 @@ test fixtures with fixed seeds for full reproducibility. Re-running this
 script always produces byte-identical output.
 
 Usage:
-    python scripts/generate_test_data.py          # regenerate all
+    python scripts/generate_test_data.py          # regenerate if needed
+    python scripts/generate_test_data.py --force  # always regenerate
 """
 
+import hashlib
 import json
+import os
 import random
 import shutil
-import uuid
-from datetime import datetime, timedelta
+import sys
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
+# JSONL serialization dominates the run; orjson emits compact bytes
+# directly and skips the str→encode round-trip. The stdlib fallback
+# produces the same bytes (compact separators, raw UTF-8) so fixtures
+# don't depend on which serializer is installed.
+try:
+    from orjson import OPT_INDENT_2, dumps as _orjson_dumps
+
+    def _dumps(obj) -> bytes:
+        return _orjson_dumps(obj)
+
+    def _dumps_indent(obj) -> bytes:
+        return _orjson_dumps(obj, option=OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def _dumps_indent(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+# Binary writers skip TextIOWrapper's per-write encode; a 256 KiB
+# buffer keeps every multi-record file here to a single flush.
+_BUFSZ = 256 * 1024
+
+
+def _dumpnl(obj) -> bytes:
+    """Serialize one JSONL record, newline-terminated."""
+    return _dumps(obj) + b"\n"
+
+
+def _write_jsonl(path, records) -> int:
+    """Write records as one JSONL file; returns the record count.
+
+    One join and one os.write per file — no per-record buffered writes.
+    The loop finishes any partial write (signal, near-full disk) so a
+    short count can never silently truncate a fixture.
+    """
+    bufs = [_dumpnl(r) for r in records]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(b"".join(bufs))
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return len(bufs)
+
+
 # ─── deterministic RNG ───────────────────────────────────────────────
 SEED = 42
 _rng = random.Random(SEED)
 _uuid_counter = 0
 
+# Reusable Random instance, reseeded before each draw. Reseeding an
+# existing object yields the same stream as constructing
+# random.Random(seed) but skips one object allocation per ID — the
+# constructor cost dwarfed the single getrandbits() call.
+_uuid_rng = random.Random()
+
+# Sequential stream for derived blobs (thinking signatures, tool and
+# message IDs, backup file names). These used to be seeded from the
+# hash() of the enclosing IDs, which ran SipHash per call and — worse —
+# made the output depend on PYTHONHASHSEED, so regeneration was only
+# reproducible within a single interpreter invocation. Generation
+# order is deterministic, so drawing sequentially is just as stable
+# and bit-exact across machines.
+_blob_rng = random.Random(SEED)
+
+
+def _uuid4_hex(bits: int) -> str:
+    """32-char hex of a v4 UUID built from 128 random bits.
+
+    Applies the same variant/version bit masks as
+    uuid.UUID(int=bits, version=4) but formats directly, skipping the
+    UUID object construction and attribute walks per ID.
+    """
+    bits &= ~(0xC000 << 48)
+    bits |= 0x8000 << 48
+    bits &= ~(0xF000 << 64)
+    bits |= 0x4000 << 64
+    return f"{bits:032x}"
+
 
 def _uuid() -> str:
     """Deterministic UUID v4 using seeded RNG."""
     global _uuid_counter
     _uuid_counter += 1
-    r = random.Random(SEED + _uuid_counter)
-    return str(uuid.UUID(int=r.getrandbits(128), version=4))
+    _uuid_rng.seed(SEED + _uuid_counter)
+    h = _uuid4_hex(_uuid_rng.getrandbits(128))
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def _short_id() -> str:
     global _uuid_counter
     _uuid_counter += 1
-    r = random.Random(SEED + _uuid_counter)
-    return "a" + uuid.UUID(int=r.getrandbits(128), version=4).hex[:7]
+    _uuid_rng.seed(SEED + _uuid_counter)
+    return "a" + _uuid4_hex(_uuid_rng.getrandbits(128))[:7]
+
+
+def _blob_hex(length: int) -> str:
+    """Next deterministic hex blob from the sequential ID stream."""
+    return _uuid4_hex(_blob_rng.getrandbits(128))[:length]
 
 
 # ─── Claude configuration ────────────────────────────────────────────
@@ -97,26 +183,58 @@ def generate_slug() -> str:
 def generate_timestamp(base: datetime, offset_minutes: int = 0) -> str:
     ts = base + timedelta(minutes=offset_minutes)
     ms = _rng.randint(0, 999)
-    return ts.strftime("%Y-%m-%dT%H:%M:%S.") + f"{ms:03d}Z"
+    # isoformat emits the identical prefix without strftime's format
+    # parsing and locale machinery on every message.
+    return f"{ts.isoformat(timespec='seconds')}.{ms:03d}Z"
+
+
+# Message skeletons: copying a template reuses interned, hash-cached
+# keys instead of rebuilding a ~14-key dict literal per message. The
+# placeholder None keys keep the serialized key order identical to the
+# original literals; nested constants are shared (never mutated here).
+_USER_TEMPLATE = {
+    "type": "user",
+    "uuid": None,
+    "parentUuid": None,
+    "timestamp": None,
+    "sessionId": None,
+    "cwd": None,
+    "version": "2.0.76",
+    "slug": None,
+    "gitBranch": "main",
+    "userType": "external",
+    "isSidechain": False,
+    "message": None,
+    "thinkingMetadata": {"level": "high", "disabled": False, "triggers": []},
+    "todos": [],
+}
+
+_ASSISTANT_TEMPLATE = {
+    "type": "assistant",
+    "uuid": None,
+    "parentUuid": None,
+    "timestamp": None,
+    "sessionId": None,
+    "cwd": None,
+    "version": "2.0.76",
+    "slug": None,
+    "gitBranch": "main",
+    "userType": "external",
+    "isSidechain": False,
+    "message": None,
+}
 
 
 def create_user_message(session_id, parent_uuid, slug, cwd, timestamp, content):
-    return {
-        "type": "user",
-        "uuid": _uuid(),
-        "parentUuid": parent_uuid,
-        "timestamp": timestamp,
-        "sessionId": session_id,
-        "cwd": cwd,
-        "version": "2.0.76",
-        "slug": slug,
-        "gitBranch": "main",
-        "userType": "external",
-        "isSidechain": False,
-        "message": {"role": "user", "content": content},
-        "thinkingMetadata": {"level": "high", "disabled": False, "triggers": []},
-        "todos": [],
-    }
+    msg = _USER_TEMPLATE.copy()
+    msg["uuid"] = _uuid()
+    msg["parentUuid"] = parent_uuid
+    msg["timestamp"] = timestamp
+    msg["sessionId"] = session_id
+    msg["cwd"] = cwd
+    msg["slug"] = slug
+    msg["message"] = {"role": "user", "content": content}
+    return msg
 
 
 def create_assistant_message(session_id, parent_uuid, slug, cwd, timestamp, content, tool_use=False):
@@ -125,58 +243,56 @@ def create_assistant_message(session_id, parent_uuid, slug, cwd, timestamp, cont
         {
             "type": "thinking",
             "thinking": f"Analyzing the request: {content[:50]}...",
-            "signature": "sig_" + uuid.UUID(int=random.Random(SEED + hash(msg_uuid)).getrandbits(128), version=4).hex[:20],
+            "signature": "sig_" + _blob_hex(20),
         }
     ]
     if tool_use:
         tool_name, tool_input = _rng.choice(TOOLS)
         content_blocks.append({
             "type": "tool_use",
-            "id": "toolu_" + uuid.UUID(int=random.Random(SEED + hash(msg_uuid) + 1).getrandbits(128), version=4).hex[:20],
+            "id": "toolu_" + _blob_hex(20),
             "name": tool_name,
             "input": tool_input,
         })
     content_blocks.append({"type": "text", "text": f"Response to: {content}"})
 
-    return {
-        "type": "assistant",
-        "uuid": msg_uuid,
-        "parentUuid": parent_uuid,
-        "timestamp": timestamp,
-        "sessionId": session_id,
-        "cwd": cwd,
-        "version": "2.0.76",
-        "slug": slug,
-        "gitBranch": "main",
-        "userType": "external",
-        "isSidechain": False,
-        "message": {
-            "model": "claude-sonnet-4-20250514",
-            "id": "msg_" + uuid.UUID(int=random.Random(SEED + hash(msg_uuid) + 2).getrandbits(128), version=4).hex[:20],
-            "type": "message",
-            "role": "assistant",
-            "content": content_blocks,
-            "stop_reason": "end_turn",
-            "stop_sequence": None,
-            "usage": {
-                "input_tokens": _rng.randint(100, 5000),
-                "output_tokens": _rng.randint(50, 2000),
-                "cache_creation_input_tokens": _rng.randint(0, 1000),
-                "cache_read_input_tokens": _rng.randint(0, 500),
-            },
+    msg = _ASSISTANT_TEMPLATE.copy()
+    msg["uuid"] = msg_uuid
+    msg["parentUuid"] = parent_uuid
+    msg["timestamp"] = timestamp
+    msg["sessionId"] = session_id
+    msg["cwd"] = cwd
+    msg["slug"] = slug
+    msg["message"] = {
+        "model": "claude-sonnet-4-20250514",
+        "id": "msg_" + _blob_hex(20),
+        "type": "message",
+        "role": "assistant",
+        "content": content_blocks,
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": _rng.randint(100, 5000),
+            "output_tokens": _rng.randint(50, 2000),
+            "cache_creation_input_tokens": _rng.randint(0, 1000),
+            "cache_read_input_tokens": _rng.randint(0, 500),
         },
     }
+    return msg
 
 
 def create_file_history_snapshot(message_id: str, files: List[str]):
-    backups = {}
-    for f in files:
-        r = random.Random(SEED + hash(message_id + f))
-        backups[f] = {
-            "backupFileName": uuid.UUID(int=r.getrandbits(128), version=4).hex[:16] + "@v" + str(_rng.randint(1, 5)),
+    # Per-file draw order matches the old accumulation loop exactly —
+    # name blob, version suffix, version, then timestamp — so the
+    # seeded stream and fixtures are unchanged.
+    backups = {
+        f: {
+            "backupFileName": f"{_blob_hex(16)}@v{_rng.randint(1, 5)}",
             "version": _rng.randint(1, 5),
             "backupTime": generate_timestamp(BASE_TIME),
         }
+        for f in files
+    }
     return {
         "type": "file-history-snapshot",
         "messageId": message_id,
@@ -194,51 +310,63 @@ def create_summary_message(leaf_uuid: str, summary: str):
 
 
 def generate_conversation(session_id, project_path, slug, base_time):
-    messages = []
+    # Message count is fully determined by MESSAGES_PER_SESSION (a user/
+    # assistant pair per turn, a snapshot every fourth turn, one summary),
+    # so preallocate once and assign by index instead of growing the list.
+    n_snapshots = (MESSAGES_PER_SESSION + 3) // 4
+    messages = [None] * (MESSAGES_PER_SESSION * 2 + n_snapshots + 1)
     parent_uuid = None
+    k = 0
     for i in range(MESSAGES_PER_SESSION):
         ts = generate_timestamp(base_time, i * 5)
         user_msg = create_user_message(session_id, parent_uuid, slug, project_path, ts, _rng.choice(SAMPLE_PROMPTS))
-        messages.append(user_msg)
+        messages[k] = user_msg
+        k += 1
         parent_uuid = user_msg["uuid"]
 
         assistant_msg = create_assistant_message(session_id, parent_uuid, slug, project_path,
                                                   generate_timestamp(base_time, i * 5 + 1),
                                                   user_msg["message"]["content"],
                                                   tool_use=(i % 3 == 0))
-        messages.append(assistant_msg)
+        messages[k] = assistant_msg
+        k += 1
         parent_uuid = assistant_msg["uuid"]
 
         if i % 4 == 0:
-            messages.append(create_file_history_snapshot(assistant_msg["uuid"], ["src/main.py", "tests/test_main.py"]))
-
-    if messages:
-        messages.append(create_summary_message(messages[-1].get("uuid", _uuid()),
-                                                f"Conversation about {project_path.split('/')[-1]}"))
+            messages[k] = create_file_history_snapshot(assistant_msg["uuid"], ["src/main.py", "tests/test_main.py"])
+            k += 1
+
+    if k:
+        messages[k] = create_summary_message(messages[k - 1].get("uuid", _uuid()),
+                                              f"Conversation about {project_path.split('/')[-1]}")
+        k += 1
+    del messages[k:]
     return messages
 
 
-def generate_agent_conversation(session_id, agent_id, project_path, slug, base_time):
-    messages = []
+def iter_agent_conversation(session_id, agent_id, project_path, slug, base_time):
+    # Generator rather than a list: the writer is the only consumer, so
+    # the messages stream straight into _write_jsonl without an
+    # intermediate list of dicts.
     parent_uuid = None
     for i in range(3):
         ts = generate_timestamp(base_time, i * 2)
         user_msg = create_user_message(session_id, parent_uuid, slug, project_path, ts, "Explore the codebase structure")
         user_msg["agentId"] = agent_id
-        messages.append(user_msg)
+        yield user_msg
         parent_uuid = user_msg["uuid"]
 
         assistant_msg = create_assistant_message(session_id, parent_uuid, slug, project_path,
                                                   generate_timestamp(base_time, i * 2 + 1),
                                                   "Exploring codebase...", tool_use=True)
         assistant_msg["agentId"] = agent_id
-        messages.append(assistant_msg)
+        yield assistant_msg
         parent_uuid = assistant_msg["uuid"]
-    return messages
 
 
-def generate_plan_content(slug: str) -> str:
-    return f"""# Implementation Plan: {slug}
+# Static bodies hoisted to module scope: built once at import instead
+# of re-evaluating a multi-line f-string (or string literal) per call.
+_PLAN_TEMPLATE = """# Implementation Plan: {SLUG}
 
 ## Problem Statement
 
@@ -273,6 +401,19 @@ This plan addresses the implementation of a new feature for the project.
 - Ensure backward compatibility
 """
 
+_CLAUDE_MD = (
+    "# Test Claude Configuration\n\n"
+    "This is a test Claude Code data directory for extension development.\n\n"
+    "## Project Guidelines\n\n"
+    "- Follow TDD practices\n"
+    "- Document all public APIs\n"
+    "- Maintain 80% test coverage\n"
+)
+
+
+def generate_plan_content(slug: str) -> str:
+    return _PLAN_TEMPLATE.replace("{SLUG}", slug)
+
 
 def generate_todo(session_id: str, agent_id: str) -> List[Dict[str, Any]]:
     statuses = ["pending", "in_progress", "completed"]
@@ -287,57 +428,73 @@ def generate_todo(session_id: str, agent_id: str) -> List[Dict[str, Any]]:
     ]
 
 
+HISTORY_PROMPTS = [
+    "Create a new component",
+    "/init",
+    "Fix the failing tests",
+    "Add logging to the service",
+    "/security-review",
+]
+
+
 def generate_history_entry(project, session_id, base_time, offset_hours):
-    prompts = [
-        "Create a new component",
-        "/init",
-        "Fix the failing tests",
-        "Add logging to the service",
-        "/security-review",
-    ]
     ts = base_time + timedelta(hours=offset_hours)
     return {
-        "display": _rng.choice(prompts),
+        "display": _rng.choice(HISTORY_PROMPTS),
         "pastedContents": {},
-        "timestamp": int(ts.timestamp() * 1000),
+        # Treat the naive timestamp as UTC: .timestamp() on a naive
+        # datetime applies the local zone, which would make the committed
+        # fixture depend on the machine's TZ.
+        "timestamp": int(ts.replace(tzinfo=timezone.utc).timestamp() * 1000),
         "project": project,
         "sessionId": session_id,
     }
 
 
 def generate_stats(num_days: int) -> Dict[str, Any]:
-    base_date = BASE_TIME - timedelta(days=num_days)
+    # Step through days by ordinal: one timedelta up front instead of a
+    # fresh timedelta per iteration, and isoformat() over the strftime
+    # format machinery for the same YYYY-MM-DD output.
+    start_ord = (BASE_TIME - timedelta(days=num_days)).toordinal()
     daily_activity = []
     for i in range(num_days):
-        date = base_date + timedelta(days=i)
         daily_activity.append({
-            "date": date.strftime("%Y-%m-%d"),
+            "date": date.fromordinal(start_ord + i).isoformat(),
             "messageCount": _rng.randint(50, 500),
             "sessionCount": _rng.randint(1, 5),
             "toolCallCount": _rng.randint(20, 200),
         })
     return {
         "version": 1,
-        "lastComputedDate": BASE_TIME.strftime("%Y-%m-%d"),
+        "lastComputedDate": BASE_TIME.date().isoformat(),
         "dailyActivity": daily_activity,
     }
 
 
 def generate_claude_data():
     """Generate complete Claude Code test data."""
-    print(f"Generating Claude test data in {CLAUDE_DIR}")
+    # Progress lines are buffered and flushed once at the end; the old
+    # per-file print() took the stdout lock and line-flushed inside the
+    # tight loop.
+    progress = [f"Generating Claude test data in {CLAUDE_DIR}"]
 
     if CLAUDE_DIR.exists():
         shutil.rmtree(CLAUDE_DIR)
 
-    for d in [CLAUDE_DIR, CLAUDE_DIR / "projects", CLAUDE_DIR / "plans",
-              CLAUDE_DIR / "todos", CLAUDE_DIR / "file-history"]:
-        d.mkdir(parents=True, exist_ok=True)
+    # One makedirs per leaf; the parents (including CLAUDE_DIR itself)
+    # come for free instead of being re-walked by separate mkdir calls.
+    for d in ("projects", "plans", "todos", "file-history"):
+        os.makedirs(CLAUDE_DIR / d, exist_ok=True)
+
+    # Plain string concatenation from here down: Path.__truediv__
+    # allocates and re-parses a PurePath per file, which adds up inside
+    # the session loop. os.mkdir and open() take strings directly.
+    claude_dir_str = os.fspath(CLAUDE_DIR)
 
     all_sessions = []
     for i, project_path in enumerate(PROJECT_PATHS[:NUM_PROJECTS]):
-        project_dir = CLAUDE_DIR / "projects" / encode_project_path(project_path)
-        project_dir.mkdir(parents=True, exist_ok=True)
+        project_dir_str = f"{claude_dir_str}/projects/{encode_project_path(project_path)}"
+        os.mkdir(project_dir_str)  # parent tree already exists
 
         for j in range(SESSIONS_PER_PROJECT):
             session_id = _uuid()
@@ -345,71 +502,65 @@ def generate_claude_data():
             session_time = BASE_TIME + timedelta(days=i, hours=j * 4)
 
             conversation = generate_conversation(session_id, project_path, slug, session_time)
-            conv_file = project_dir / f"{session_id}.jsonl"
-            with open(conv_file, "w") as f:
-                for msg in conversation:
-                    f.write(json.dumps(msg) + "\n")
-            print(f"  {conv_file.name} ({len(conversation)} lines)")
+            conv_name = f"{session_id}.jsonl"
+            lines = _write_jsonl(f"{project_dir_str}/{conv_name}", conversation)
+            progress.append(f"  {conv_name} ({lines} lines)")
 
             for k in range(AGENTS_PER_SESSION):
                 agent_id = _short_id()
-                agent_conv = generate_agent_conversation(session_id, agent_id, project_path, slug, session_time)
-                agent_file = project_dir / f"agent-{agent_id}.jsonl"
-                with open(agent_file, "w") as f:
-                    for msg in agent_conv:
-                        f.write(json.dumps(msg) + "\n")
-                print(f"  {agent_file.name} ({len(agent_conv)} lines)")
+                agent_name = f"agent-{agent_id}.jsonl"
+                lines = _write_jsonl(f"{project_dir_str}/{agent_name}",
+                                     iter_agent_conversation(session_id, agent_id, project_path, slug, session_time))
+                progress.append(f"  {agent_name} ({lines} lines)")
 
             all_sessions.append((session_id, project_path, slug))
 
-            fh_dir = CLAUDE_DIR / "file-history" / session_id
-            fh_dir.mkdir(parents=True, exist_ok=True)
+            fh_dir = f"{claude_dir_str}/file-history/{session_id}"
+            os.mkdir(fh_dir)
             for fi in range(2):
-                r = random.Random(SEED + hash(session_id) + fi)
-                fh_file = fh_dir / f"{uuid.UUID(int=r.getrandbits(128), version=4).hex[:16]}@v{fi + 1}"
-                fh_file.write_text(f"# Backup content version {fi + 1}")
+                with open(f"{fh_dir}/{_blob_hex(16)}@v{fi + 1}", "w") as f:
+                    f.write(f"# Backup content version {fi + 1}")
 
     # Plans
-    print("  Plans:")
+    progress.append("  Plans:")
     for i in range(NUM_PLANS):
         slug = generate_slug()
-        (CLAUDE_DIR / "plans" / f"{slug}.md").write_text(generate_plan_content(slug))
-        print(f"    {slug}.md")
+        with open(f"{claude_dir_str}/plans/{slug}.md", "w") as f:
+            f.write(generate_plan_content(slug))
+        progress.append(f"    {slug}.md")
 
     # Todos
-    print("  Todos:")
+    progress.append("  Todos:")
     for session_id, project_path, slug in all_sessions[:NUM_TODOS]:
         agent_id = _uuid()
         items = generate_todo(session_id, agent_id)
-        todo_file = CLAUDE_DIR / "todos" / f"{session_id}-agent-{agent_id}.json"
-        with open(todo_file, "w") as f:
-            json.dump(items, f, indent=2)
-        print(f"    {todo_file.name} ({len(items)} items)")
-
-    # History
-    history_file = CLAUDE_DIR / "history.jsonl"
-    with open(history_file, "w") as f:
-        for i in range(NUM_HISTORY_ENTRIES):
-            session_id, project, slug = _rng.choice(all_sessions)
-            f.write(json.dumps(generate_history_entry(project, session_id, BASE_TIME, i)) + "\n")
-    print(f"  history.jsonl ({NUM_HISTORY_ENTRIES} entries)")
+        todo_name = f"{session_id}-agent-{agent_id}.json"
+        # Compact: only the extension reads these, never a human editor.
+        with open(f"{claude_dir_str}/todos/{todo_name}", "wb", buffering=_BUFSZ) as f:
+            f.write(_dumps(items))
+        progress.append(f"    {todo_name} ({len(items)} items)")
+
+    # History. The session pick and the prompt pick inside
+    # generate_history_entry stay interleaved in the original order so
+    # the seeded RNG stream (and the committed fixture) is unchanged.
+    def _entry(i):
+        session_id, project, slug = _rng.choice(all_sessions)
+        return generate_history_entry(project, session_id, BASE_TIME, i)
+
+    _write_jsonl(f"{claude_dir_str}/history.jsonl",
+                 (_entry(i) for i in range(NUM_HISTORY_ENTRIES)))
+    progress.append(f"  history.jsonl ({NUM_HISTORY_ENTRIES} entries)")
 
     # Stats
     stats = generate_stats(NUM_STATS_DAYS)
-    with open(CLAUDE_DIR / "stats-cache.json", "w") as f:
-        json.dump(stats, f, indent=2)
-    print(f"  stats-cache.json ({NUM_STATS_DAYS} days)")
+    with open(CLAUDE_DIR / "stats-cache.json", "wb", buffering=_BUFSZ) as f:
+        f.write(_dumps(stats))
+    progress.append(f"  stats-cache.json ({NUM_STATS_DAYS} days)")
 
     # CLAUDE.md
-    (CLAUDE_DIR / "CLAUDE.md").write_text(
-        "# Test Claude Configuration\n\n"
-        "This is a test Claude Code data directory for extension development.\n\n"
-        "## Project Guidelines\n\n"
-        "- Follow TDD practices\n"
-        "- Document all public APIs\n"
-        "- Maintain 80% test coverage\n"
-    )
-    print("  CLAUDE.md")
+    (CLAUDE_DIR / "CLAUDE.md").write_text(_CLAUDE_MD)
+    progress.append("  CLAUDE.md")
+    sys.stdout.write("\n".join(progress) + "\n")
 
 
 # ─── Copilot generators ──────────────────────────────────────────────
@@ -417,107 +568,172 @@ def generate_claude_data():
 COPILOT_DIR = Path("test/data_copilot")
 
 
+
+# Session IDs (deterministic, human-readable)
+S1 = "aaaa1111-0000-0000-0000-000000000001"
+S2 = "bbbb2222-0000-0000-0000-000000000002"
+S3 = "cccc3333-0000-0000-0000-000000000003"
+S4 = "dddd4444-0000-0000-0000-000000000004"
+
+# The event streams are fully static; build them once at import
+# instead of reallocating every nested dict per run.
+def _evt(prefix: str, seq: int, type_: str, timestamp: str, data: dict) -> dict:
+    """One Copilot event; IDs and parent links follow from the sequence.
+
+    Every event in these fixtures chains linearly, so only the varying
+    fields are spelled out and the shared skeleton lives here.
+    """
+    return {
+        "type": type_,
+        "id": f"evt-{prefix}-{seq:04d}",
+        "timestamp": timestamp,
+        "parentId": f"evt-{prefix}-{seq - 1:04d}" if seq > 1 else None,
+        "data": data,
+    }
+
+
+S1_EVENTS = [
+    _evt("aaaa", 1, "session.start", "2026-01-15T10:00:00.000Z",
+         {"sessionId": S1, "copilotVersion": "0.0.400", "context": {"cwd": "/Users/testuser/project-alpha", "gitRoot": "/Users/testuser/project-alpha", "branch": "main", "repository": "testuser/project-alpha"}}),
+    _evt("aaaa", 2, "session.info", "2026-01-15T10:00:01.000Z",
+         {"infoType": "authentication", "message": "Logged in as testuser"}),
+    _evt("aaaa", 3, "user.message", "2026-01-15T10:00:02.000Z",
+         {"content": "Create a hello world function"}),
+    _evt("aaaa", 4, "assistant.turn_start", "2026-01-15T10:00:03.000Z",
+         {"turnId": "turn-1"}),
+    _evt("aaaa", 5, "assistant.message", "2026-01-15T10:00:04.000Z",
+         {"messageId": "msg-001", "content": "I'll create a hello world function for you.", "toolRequests": [{"toolCallId": "tc-001", "name": "edit", "arguments": {"file": "hello.py", "content": "def hello():\n    return 'Hello, World!'"}}]}),
+    _evt("aaaa", 6, "tool.execution_start", "2026-01-15T10:00:05.000Z",
+         {"toolCallId": "tc-001", "toolName": "edit", "arguments": {"file": "hello.py", "content": "def hello():\n    return 'Hello, World!'"}}),
+    _evt("aaaa", 7, "tool.execution_complete", "2026-01-15T10:00:06.000Z",
+         {"toolCallId": "tc-001", "success": True, "result": {"content": "File hello.py written successfully"}}),
+    _evt("aaaa", 8, "assistant.message", "2026-01-15T10:00:07.000Z",
+         {"messageId": "msg-002", "content": "I've created the hello world function in hello.py."}),
+    _evt("aaaa", 9, "assistant.turn_end", "2026-01-15T10:00:08.000Z",
+         {"turnId": "turn-1"}),
+    _evt("aaaa", 10, "session.truncation", "2026-01-15T10:00:09.000Z",
+         {"tokenLimit": 128000, "preTruncationTokensInMessages": 95000, "postTruncationTokensInMessages": 80000}),
+    _evt("aaaa", 11, "user.message", "2026-01-15T10:01:00.000Z",
+         {"content": "Now add unit tests for that function"}),
+    _evt("aaaa", 12, "assistant.turn_start", "2026-01-15T10:01:01.000Z",
+         {"turnId": "turn-2"}),
+    _evt("aaaa", 13, "assistant.reasoning", "2026-01-15T10:01:02.000Z",
+         {"reasoningId": "r-001", "content": "I need to write pytest tests for the hello function."}),
+    _evt("aaaa", 14, "assistant.message", "2026-01-15T10:01:03.000Z",
+         {"messageId": "msg-003", "content": "I'll write unit tests using pytest.", "toolRequests": [{"toolCallId": "tc-002", "name": "edit", "arguments": {"file": "test_hello.py", "content": "from hello import hello\n\ndef test_hello():\n    assert hello() == 'Hello, World!'"}}]}),
+    _evt("aaaa", 15, "tool.execution_start", "2026-01-15T10:01:04.000Z",
+         {"toolCallId": "tc-002", "toolName": "edit", "arguments": {"file": "test_hello.py"}}),
+    _evt("aaaa", 16, "tool.execution_complete", "2026-01-15T10:01:05.000Z",
+         {"toolCallId": "tc-002", "success": True, "result": {"content": "File test_hello.py written successfully"}}),
+    _evt("aaaa", 17, "assistant.message", "2026-01-15T10:01:06.000Z",
+         {"messageId": "msg-004", "content": "Tests created. Let me run them.", "toolRequests": [{"toolCallId": "tc-003", "name": "bash", "arguments": {"command": "pytest test_hello.py"}}]}),
+    _evt("aaaa", 18, "assistant.turn_end", "2026-01-15T10:01:07.000Z",
+         {"turnId": "turn-2"}),
+    _evt("aaaa", 19, "session.model_change", "2026-01-15T10:02:00.000Z",
+         {"newModel": "claude-sonnet-4"}),
+    _evt("aaaa", 20, "user.message", "2026-01-15T10:02:01.000Z",
+         {"content": "Add error handling to the function"}),
+    _evt("aaaa", 21, "assistant.turn_start", "2026-01-15T10:02:02.000Z",
+         {"turnId": "turn-3"}),
+    _evt("aaaa", 22, "assistant.message", "2026-01-15T10:02:03.000Z",
+         {"messageId": "msg-005", "content": "I'll add error handling to the hello function.", "toolRequests": [{"toolCallId": "tc-004", "name": "edit", "arguments": {"file": "hello.py"}}]}),
+    _evt("aaaa", 23, "tool.execution_start", "2026-01-15T10:02:04.000Z",
+         {"toolCallId": "tc-004", "toolName": "edit", "arguments": {"file": "hello.py"}}),
+    _evt("aaaa", 24, "tool.execution_complete", "2026-01-15T10:02:05.000Z",
+         {"toolCallId": "tc-004", "success": True, "result": {"content": "File hello.py updated"}}),
+    _evt("aaaa", 25, "session.error", "2026-01-15T10:02:06.000Z",
+         {"errorType": "tool_error", "message": "Syntax error in generated code"}),
+    _evt("aaaa", 26, "assistant.message", "2026-01-15T10:02:07.000Z",
+         {"messageId": "msg-006", "content": "I notice there was a syntax error. Let me fix it."}),
+    _evt("aaaa", 27, "assistant.turn_end", "2026-01-15T10:02:08.000Z",
+         {"turnId": "turn-3"}),
+    _evt("aaaa", 28, "session.compaction_start", "2026-01-15T10:03:00.000Z",
+         {}),
+    _evt("aaaa", 29, "session.compaction_complete", "2026-01-15T10:03:01.000Z",
+         {}),
+    _evt("aaaa", 30, "abort", "2026-01-15T10:03:02.000Z",
+         {"reason": "user_cancelled"}),
+]
+
+S2_EVENTS = [
+    _evt("bbbb", 1, "session.start", "2026-01-16T14:00:00.000Z",
+         {"sessionId": S2, "copilotVersion": "0.0.401", "context": {"cwd": "/Users/testuser/project-beta", "gitRoot": "/Users/testuser/project-beta", "branch": "feature/api", "repository": "testuser/project-beta"}}),
+    _evt("bbbb", 2, "session.info", "2026-01-16T14:00:01.000Z",
+         {"infoType": "context", "message": "Working on API refactoring"}),
+    _evt("bbbb", 3, "user.message", "2026-01-16T14:00:02.000Z",
+         {"content": "Refactor the REST endpoints for v2"}),
+    _evt("bbbb", 4, "assistant.message", "2026-01-16T14:00:03.000Z",
+         {"messageId": "msg-101", "content": "I'll refactor the REST endpoints.", "toolRequests": [{"toolCallId": "tc-101", "name": "grep", "arguments": {"pattern": "@app.route"}}]}),
+    _evt("bbbb", 5, "tool.execution_start", "2026-01-16T14:00:04.000Z",
+         {"toolCallId": "tc-101", "toolName": "grep", "arguments": {"pattern": "@app.route"}}),
+    _evt("bbbb", 6, "tool.execution_complete", "2026-01-16T14:00:05.000Z",
+         {"toolCallId": "tc-101", "success": True, "result": {"content": "Found 5 route definitions"}}),
+    _evt("bbbb", 7, "assistant.message", "2026-01-16T14:00:06.000Z",
+         {"messageId": "msg-102", "content": "Found 5 routes. I'll update them to v2 format."}),
+    _evt("bbbb", 8, "user.message", "2026-01-16T14:01:00.000Z",
+         {"content": "Also add authentication middleware"}),
+    _evt("bbbb", 9, "assistant.message", "2026-01-16T14:01:01.000Z",
+         {"messageId": "msg-103", "content": "I'll add JWT authentication middleware to all v2 endpoints."}),
+    _evt("bbbb", 10, "session.resume", "2026-01-16T15:00:00.000Z",
+         {"resumeTime": "2026-01-16T15:00:00.000Z", "eventCount": 9}),
+]
+
+S3_EVENTS = [
+    _evt("cccc", 1, "session.start", "2026-01-17T09:00:00.000Z",
+         {"sessionId": S3, "copilotVersion": "0.0.400", "context": {"cwd": "/Users/testuser/project-alpha", "gitRoot": "/Users/testuser/project-alpha", "branch": "develop", "repository": "testuser/project-alpha"}}),
+    _evt("cccc", 2, "user.message", "2026-01-17T09:00:01.000Z",
+         {"content": "List all TODO comments in the codebase"}),
+    _evt("cccc", 3, "assistant.turn_start", "2026-01-17T09:00:02.000Z",
+         {"turnId": "turn-1"}),
+    _evt("cccc", 4, "assistant.message", "2026-01-17T09:00:03.000Z",
+         {"messageId": "msg-201", "content": "I'll search for TODO comments.", "toolRequests": [{"toolCallId": "tc-201", "name": "grep", "arguments": {"pattern": "TODO", "path": "."}}]}),
+    _evt("cccc", 5, "tool.execution_start", "2026-01-17T09:00:04.000Z",
+         {"toolCallId": "tc-201", "toolName": "grep", "arguments": {"pattern": "TODO", "path": "."}}),
+    _evt("cccc", 6, "tool.execution_complete", "2026-01-17T09:00:05.000Z",
+         {"toolCallId": "tc-201", "success": True, "result": {"content": "hello.py:3: # TODO: add parameter support"}}),
+    _evt("cccc", 7, "assistant.turn_end", "2026-01-17T09:00:06.000Z",
+         {"turnId": "turn-1"}),
+    _evt("cccc", 8, "abort", "2026-01-17T09:00:07.000Z",
+         {"reason": "user_cancelled"}),
+]
+
+S4_EVENTS = [
+    _evt("dddd", 1, "session.start", "2026-01-18T08:00:00.000Z",
+         {"sessionId": S4, "copilotVersion": "0.0.402", "context": {"cwd": "/Users/testuser/quick-fix"}}),
+    _evt("dddd", 2, "user.message", "2026-01-18T08:00:01.000Z",
+         {"content": "Fix the typo in README"}),
+    _evt("dddd", 3, "assistant.turn_start", "2026-01-18T08:00:02.000Z",
+         {"turnId": "turn-1"}),
+    _evt("dddd", 4, "assistant.message", "2026-01-18T08:00:03.000Z",
+         {"messageId": "msg-301", "content": "I'll fix the typo in the README file."}),
+    _evt("dddd", 5, "assistant.turn_end", "2026-01-18T08:00:04.000Z",
+         {"turnId": "turn-1"}),
+]
+
+
 def generate_copilot_data():
     """Generate Copilot CLI test data with hardcoded deterministic values."""
-    print(f"\nGenerating Copilot test data in {COPILOT_DIR}")
+    progress = [f"\nGenerating Copilot test data in {COPILOT_DIR}"]
 
     if COPILOT_DIR.exists():
         shutil.rmtree(COPILOT_DIR)
 
-    # Session IDs (deterministic, human-readable)
-    S1 = "aaaa1111-0000-0000-0000-000000000001"
-    S2 = "bbbb2222-0000-0000-0000-000000000002"
-    S3 = "cccc3333-0000-0000-0000-000000000003"
-    S4 = "dddd4444-0000-0000-0000-000000000004"
+    session_state = COPILOT_DIR / "session-state"
+    os.makedirs(session_state)
 
     # ── Session 1: Full-featured session (30 events) ──
-    s1_dir = COPILOT_DIR / "session-state" / S1
-    s1_dir.mkdir(parents=True)
+    s1_dir = session_state / S1
+    os.mkdir(s1_dir)
     (s1_dir / "workspace.yaml").write_text(
         f"id: {S1}\ncwd: /Users/testuser/project-alpha\nrepository: testuser/project-alpha\nbranch: main\n"
     )
-    s1_events = [
-        {"type": "session.start", "id": "evt-aaaa-0001", "timestamp": "2026-01-15T10:00:00.000Z", "parentId": None,
-         "data": {"sessionId": S1, "copilotVersion": "0.0.400",
-                  "context": {"cwd": "/Users/testuser/project-alpha", "gitRoot": "/Users/testuser/project-alpha",
-                              "branch": "main", "repository": "testuser/project-alpha"}}},
-        {"type": "session.info", "id": "evt-aaaa-0002", "timestamp": "2026-01-15T10:00:01.000Z", "parentId": "evt-aaaa-0001",
-         "data": {"infoType": "authentication", "message": "Logged in as testuser"}},
-        {"type": "user.message", "id": "evt-aaaa-0003", "timestamp": "2026-01-15T10:00:02.000Z", "parentId": "evt-aaaa-0002",
-         "data": {"content": "Create a hello world function"}},
-        {"type": "assistant.turn_start", "id": "evt-aaaa-0004", "timestamp": "2026-01-15T10:00:03.000Z", "parentId": "evt-aaaa-0003",
-         "data": {"turnId": "turn-1"}},
-        {"type": "assistant.message", "id": "evt-aaaa-0005", "timestamp": "2026-01-15T10:00:04.000Z", "parentId": "evt-aaaa-0004",
-         "data": {"messageId": "msg-001", "content": "I'll create a hello world function for you.",
-                  "toolRequests": [{"toolCallId": "tc-001", "name": "edit",
-                                    "arguments": {"file": "hello.py", "content": "def hello():\n    return 'Hello, World!'"}}]}},
-        {"type": "tool.execution_start", "id": "evt-aaaa-0006", "timestamp": "2026-01-15T10:00:05.000Z", "parentId": "evt-aaaa-0005",
-         "data": {"toolCallId": "tc-001", "toolName": "edit",
-                  "arguments": {"file": "hello.py", "content": "def hello():\n    return 'Hello, World!'"}}},
-        {"type": "tool.execution_complete", "id": "evt-aaaa-0007", "timestamp": "2026-01-15T10:00:06.000Z", "parentId": "evt-aaaa-0006",
-         "data": {"toolCallId": "tc-001", "success": True, "result": {"content": "File hello.py written successfully"}}},
-        {"type": "assistant.message", "id": "evt-aaaa-0008", "timestamp": "2026-01-15T10:00:07.000Z", "parentId": "evt-aaaa-0007",
-         "data": {"messageId": "msg-002", "content": "I've created the hello world function in hello.py."}},
-        {"type": "assistant.turn_end", "id": "evt-aaaa-0009", "timestamp": "2026-01-15T10:00:08.000Z", "parentId": "evt-aaaa-0008",
-         "data": {"turnId": "turn-1"}},
-        {"type": "session.truncation", "id": "evt-aaaa-0010", "timestamp": "2026-01-15T10:00:09.000Z", "parentId": "evt-aaaa-0009",
-         "data": {"tokenLimit": 128000, "preTruncationTokensInMessages": 95000, "postTruncationTokensInMessages": 80000}},
-        # Turn 2
-        {"type": "user.message", "id": "evt-aaaa-0011", "timestamp": "2026-01-15T10:01:00.000Z", "parentId": "evt-aaaa-0010",
-         "data": {"content": "Now add unit tests for that function"}},
-        {"type": "assistant.turn_start", "id": "evt-aaaa-0012", "timestamp": "2026-01-15T10:01:01.000Z", "parentId": "evt-aaaa-0011",
-         "data": {"turnId": "turn-2"}},
-        {"type": "assistant.reasoning", "id": "evt-aaaa-0013", "timestamp": "2026-01-15T10:01:02.000Z", "parentId": "evt-aaaa-0012",
-         "data": {"reasoningId": "r-001", "content": "I need to write pytest tests for the hello function."}},
-        {"type": "assistant.message", "id": "evt-aaaa-0014", "timestamp": "2026-01-15T10:01:03.000Z", "parentId": "evt-aaaa-0013",
-         "data": {"messageId": "msg-003", "content": "I'll write unit tests using pytest.",
-                  "toolRequests": [{"toolCallId": "tc-002", "name": "edit",
-                                    "arguments": {"file": "test_hello.py",
-                                                  "content": "from hello import hello\n\ndef test_hello():\n    assert hello() == 'Hello, World!'"}}]}},
-        {"type": "tool.execution_start", "id": "evt-aaaa-0015", "timestamp": "2026-01-15T10:01:04.000Z", "parentId": "evt-aaaa-0014",
-         "data": {"toolCallId": "tc-002", "toolName": "edit", "arguments": {"file": "test_hello.py"}}},
-        {"type": "tool.execution_complete", "id": "evt-aaaa-0016", "timestamp": "2026-01-15T10:01:05.000Z", "parentId": "evt-aaaa-0015",
-         "data": {"toolCallId": "tc-002", "success": True, "result": {"content": "File test_hello.py written successfully"}}},
-        {"type": "assistant.message", "id": "evt-aaaa-0017", "timestamp": "2026-01-15T10:01:06.000Z", "parentId": "evt-aaaa-0016",
-         "data": {"messageId": "msg-004", "content": "Tests created. Let me run them.",
-                  "toolRequests": [{"toolCallId": "tc-003", "name": "bash", "arguments": {"command": "pytest test_hello.py"}}]}},
-        {"type": "assistant.turn_end", "id": "evt-aaaa-0018", "timestamp": "2026-01-15T10:01:07.000Z", "parentId": "evt-aaaa-0017",
-         "data": {"turnId": "turn-2"}},
-        {"type": "session.model_change", "id": "evt-aaaa-0019", "timestamp": "2026-01-15T10:02:00.000Z", "parentId": "evt-aaaa-0018",
-         "data": {"newModel": "claude-sonnet-4"}},
-        # Turn 3
-        {"type": "user.message", "id": "evt-aaaa-0020", "timestamp": "2026-01-15T10:02:01.000Z", "parentId": "evt-aaaa-0019",
-         "data": {"content": "Add error handling to the function"}},
-        {"type": "assistant.turn_start", "id": "evt-aaaa-0021", "timestamp": "2026-01-15T10:02:02.000Z", "parentId": "evt-aaaa-0020",
-         "data": {"turnId": "turn-3"}},
-        {"type": "assistant.message", "id": "evt-aaaa-0022", "timestamp": "2026-01-15T10:02:03.000Z", "parentId": "evt-aaaa-0021",
-         "data": {"messageId": "msg-005", "content": "I'll add error handling to the hello function.",
-                  "toolRequests": [{"toolCallId": "tc-004", "name": "edit", "arguments": {"file": "hello.py"}}]}},
-        {"type": "tool.execution_start", "id": "evt-aaaa-0023", "timestamp": "2026-01-15T10:02:04.000Z", "parentId": "evt-aaaa-0022",
-         "data": {"toolCallId": "tc-004", "toolName": "edit", "arguments": {"file": "hello.py"}}},
-        {"type": "tool.execution_complete", "id": "evt-aaaa-0024", "timestamp": "2026-01-15T10:02:05.000Z", "parentId": "evt-aaaa-0023",
-         "data": {"toolCallId": "tc-004", "success": True, "result": {"content": "File hello.py updated"}}},
-        {"type": "session.error", "id": "evt-aaaa-0025", "timestamp": "2026-01-15T10:02:06.000Z", "parentId": "evt-aaaa-0024",
-         "data": {"errorType": "tool_error", "message": "Syntax error in generated code"}},
-        {"type": "assistant.message", "id": "evt-aaaa-0026", "timestamp": "2026-01-15T10:02:07.000Z", "parentId": "evt-aaaa-0025",
-         "data": {"messageId": "msg-006", "content": "I notice there was a syntax error. Let me fix it."}},
-        {"type": "assistant.turn_end", "id": "evt-aaaa-0027", "timestamp": "2026-01-15T10:02:08.000Z", "parentId": "evt-aaaa-0026",
-         "data": {"turnId": "turn-3"}},
-        {"type": "session.compaction_start", "id": "evt-aaaa-0028", "timestamp": "2026-01-15T10:03:00.000Z", "parentId": "evt-aaaa-0027",
-         "data": {}},
-        {"type": "session.compaction_complete", "id": "evt-aaaa-0029", "timestamp": "2026-01-15T10:03:01.000Z", "parentId": "evt-aaaa-0028",
-         "data": {}},
-        {"type": "abort", "id": "evt-aaaa-0030", "timestamp": "2026-01-15T10:03:02.000Z", "parentId": "evt-aaaa-0029",
-         "data": {"reason": "user_cancelled"}},
-    ]
-    with open(s1_dir / "events.jsonl", "w") as f:
-        for evt in s1_events:
-            f.write(json.dumps(evt) + "\n")
-    print(f"  session {S1[:8]}... ({len(s1_events)} events)")
+    with open(s1_dir / "events.jsonl", "wb", buffering=0) as f:
+        f.write(b"".join(_dumpnl(evt) for evt in S1_EVENTS))
+    progress.append(f"  session {S1[:8]}... ({len(S1_EVENTS)} events)")
 
     # Checkpoints for session 1
     cp_dir = s1_dir / "checkpoints"
-    cp_dir.mkdir()
+    os.mkdir(cp_dir)
     (cp_dir / "index.md").write_text("# Checkpoints Index\n\n- [001-initial-setup](001-initial-setup.md) - Initial project setup checkpoint\n")
     (cp_dir / "001-initial-setup.md").write_text(
         "# Initial Setup Checkpoint\n"
@@ -526,42 +742,16 @@ def generate_copilot_data():
         "- [ ] Write unit tests\n"
         "- [ ] Configure CI pipeline\n"
     )
-    print("  checkpoints (1 checkpoint, 4 items)")
+    progress.append("  checkpoints (1 checkpoint, 4 items)")
 
     # ── Session 2: API refactoring (10 events) ──
-    s2_dir = COPILOT_DIR / "session-state" / S2
-    s2_dir.mkdir(parents=True)
+    s2_dir = session_state / S2
+    os.mkdir(s2_dir)
     (s2_dir / "workspace.yaml").write_text(
         f"id: {S2}\ncwd: /Users/testuser/project-beta\nrepository: testuser/project-beta\nbranch: feature/api\n"
     )
-    s2_events = [
-        {"type": "session.start", "id": "evt-bbbb-0001", "timestamp": "2026-01-16T14:00:00.000Z", "parentId": None,
-         "data": {"sessionId": S2, "copilotVersion": "0.0.401",
-                  "context": {"cwd": "/Users/testuser/project-beta", "gitRoot": "/Users/testuser/project-beta",
-                              "branch": "feature/api", "repository": "testuser/project-beta"}}},
-        {"type": "session.info", "id": "evt-bbbb-0002", "timestamp": "2026-01-16T14:00:01.000Z", "parentId": "evt-bbbb-0001",
-         "data": {"infoType": "context", "message": "Working on API refactoring"}},
-        {"type": "user.message", "id": "evt-bbbb-0003", "timestamp": "2026-01-16T14:00:02.000Z", "parentId": "evt-bbbb-0002",
-         "data": {"content": "Refactor the REST endpoints for v2"}},
-        {"type": "assistant.message", "id": "evt-bbbb-0004", "timestamp": "2026-01-16T14:00:03.000Z", "parentId": "evt-bbbb-0003",
-         "data": {"messageId": "msg-101", "content": "I'll refactor the REST endpoints.",
-                  "toolRequests": [{"toolCallId": "tc-101", "name": "grep", "arguments": {"pattern": "@app.route"}}]}},
-        {"type": "tool.execution_start", "id": "evt-bbbb-0005", "timestamp": "2026-01-16T14:00:04.000Z", "parentId": "evt-bbbb-0004",
-         "data": {"toolCallId": "tc-101", "toolName": "grep", "arguments": {"pattern": "@app.route"}}},
-        {"type": "tool.execution_complete", "id": "evt-bbbb-0006", "timestamp": "2026-01-16T14:00:05.000Z", "parentId": "evt-bbbb-0005",
-         "data": {"toolCallId": "tc-101", "success": True, "result": {"content": "Found 5 route definitions"}}},
-        {"type": "assistant.message", "id": "evt-bbbb-0007", "timestamp": "2026-01-16T14:00:06.000Z", "parentId": "evt-bbbb-0006",
-         "data": {"messageId": "msg-102", "content": "Found 5 routes. I'll update them to v2 format."}},
-        {"type": "user.message", "id": "evt-bbbb-0008", "timestamp": "2026-01-16T14:01:00.000Z", "parentId": "evt-bbbb-0007",
-         "data": {"content": "Also add authentication middleware"}},
-        {"type": "assistant.message", "id": "evt-bbbb-0009", "timestamp": "2026-01-16T14:01:01.000Z", "parentId": "evt-bbbb-0008",
-         "data": {"messageId": "msg-103", "content": "I'll add JWT authentication middleware to all v2 endpoints."}},
-        {"type": "session.resume", "id": "evt-bbbb-0010", "timestamp": "2026-01-16T15:00:00.000Z", "parentId": "evt-bbbb-0009",
-         "data": {"resumeTime": "2026-01-16T15:00:00.000Z", "eventCount": 9}},
-    ]
-    with open(s2_dir / "events.jsonl", "w") as f:
-        for evt in s2_events:
-            f.write(json.dumps(evt) + "\n")
+    with open(s2_dir / "events.jsonl", "wb", buffering=0) as f:
+        f.write(b"".join(_dumpnl(evt) for evt in S2_EVENTS))
     (s2_dir / "plan.md").write_text(
         "# API Refactoring Plan\n\n"
         "## Problem\n"
@@ -571,60 +761,24 @@ def generate_copilot_data():
         "- [ ] Implement authentication middleware\n"
         "- [ ] Add rate limiting\n"
     )
-    print(f"  session {S2[:8]}... ({len(s2_events)} events + plan)")
+    progress.append(f"  session {S2[:8]}... ({len(S2_EVENTS)} events + plan)")
 
     # ── Session 3: Code search (8 events) ──
-    s3_dir = COPILOT_DIR / "session-state" / S3
-    s3_dir.mkdir(parents=True)
+    s3_dir = session_state / S3
+    os.mkdir(s3_dir)
     (s3_dir / "workspace.yaml").write_text(
         f"id: {S3}\ncwd: /Users/testuser/project-alpha\nrepository: testuser/project-alpha\nbranch: feature/tests\n"
     )
-    s3_events = [
-        {"type": "session.start", "id": "evt-cccc-0001", "timestamp": "2026-01-17T09:00:00.000Z", "parentId": None,
-         "data": {"sessionId": S3, "copilotVersion": "0.0.400",
-                  "context": {"cwd": "/Users/testuser/project-alpha", "gitRoot": "/Users/testuser/project-alpha",
-                              "branch": "develop", "repository": "testuser/project-alpha"}}},
-        {"type": "user.message", "id": "evt-cccc-0002", "timestamp": "2026-01-17T09:00:01.000Z", "parentId": "evt-cccc-0001",
-         "data": {"content": "List all TODO comments in the codebase"}},
-        {"type": "assistant.turn_start", "id": "evt-cccc-0003", "timestamp": "2026-01-17T09:00:02.000Z", "parentId": "evt-cccc-0002",
-         "data": {"turnId": "turn-1"}},
-        {"type": "assistant.message", "id": "evt-cccc-0004", "timestamp": "2026-01-17T09:00:03.000Z", "parentId": "evt-cccc-0003",
-         "data": {"messageId": "msg-201", "content": "I'll search for TODO comments.",
-                  "toolRequests": [{"toolCallId": "tc-201", "name": "grep", "arguments": {"pattern": "TODO", "path": "."}}]}},
-        {"type": "tool.execution_start", "id": "evt-cccc-0005", "timestamp": "2026-01-17T09:00:04.000Z", "parentId": "evt-cccc-0004",
-         "data": {"toolCallId": "tc-201", "toolName": "grep", "arguments": {"pattern": "TODO", "path": "."}}},
-        {"type": "tool.execution_complete", "id": "evt-cccc-0006", "timestamp": "2026-01-17T09:00:05.000Z", "parentId": "evt-cccc-0005",
-         "data": {"toolCallId": "tc-201", "success": True, "result": {"content": "hello.py:3: # TODO: add parameter support"}}},
-        {"type": "assistant.turn_end", "id": "evt-cccc-0007", "timestamp": "2026-01-17T09:00:06.000Z", "parentId": "evt-cccc-0006",
-         "data": {"turnId": "turn-1"}},
-        {"type": "abort", "id": "evt-cccc-0008", "timestamp": "2026-01-17T09:00:07.000Z", "parentId": "evt-cccc-0007",
-         "data": {"reason": "user_cancelled"}},
-    ]
-    with open(s3_dir / "events.jsonl", "w") as f:
-        for evt in s3_events:
-            f.write(json.dumps(evt) + "\n")
-    print(f"  session {S3[:8]}... ({len(s3_events)} events)")
+    with open(s3_dir / "events.jsonl", "wb", buffering=0) as f:
+        f.write(b"".join(_dumpnl(evt) for evt in S3_EVENTS))
+    progress.append(f"  session {S3[:8]}... ({len(S3_EVENTS)} events)")
 
     # ── Session 4: Flat JSONL (no directory, 5 events) ──
-    s4_events = [
-        {"type": "session.start", "id": "evt-dddd-0001", "timestamp": "2026-01-18T08:00:00.000Z", "parentId": None,
-         "data": {"sessionId": S4, "copilotVersion": "0.0.402",
-                  "context": {"cwd": "/Users/testuser/quick-fix"}}},
-        {"type": "user.message", "id": "evt-dddd-0002", "timestamp": "2026-01-18T08:00:01.000Z", "parentId": "evt-dddd-0001",
-         "data": {"content": "Fix the typo in README"}},
-        {"type": "assistant.turn_start", "id": "evt-dddd-0003", "timestamp": "2026-01-18T08:00:02.000Z", "parentId": "evt-dddd-0002",
-         "data": {"turnId": "turn-1"}},
-        {"type": "assistant.message", "id": "evt-dddd-0004", "timestamp": "2026-01-18T08:00:03.000Z", "parentId": "evt-dddd-0003",
-         "data": {"messageId": "msg-301", "content": "I'll fix the typo in the README file."}},
-        {"type": "assistant.turn_end", "id": "evt-dddd-0005", "timestamp": "2026-01-18T08:00:04.000Z", "parentId": "evt-dddd-0004",
-         "data": {"turnId": "turn-1"}},
-    ]
-    s4_file = COPILOT_DIR / "session-state" / f"{S4}.jsonl"
-    s4_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(s4_file, "w") as f:
-        for evt in s4_events:
-            f.write(json.dumps(evt) + "\n")
-    print(f"  session {S4[:8]}... ({len(s4_events)} events, flat file)")
+    s4_file = session_state / f"{S4}.jsonl"
+    with open(s4_file, "wb", buffering=_BUFSZ) as f:
+        # writelines drains the generator in C — no per-event write call
+        f.writelines(_dumpnl(evt) for evt in S4_EVENTS)
+    progress.append(f"  session {S4[:8]}... ({len(S4_EVENTS)} events, flat file)")
 
     # ── Command history ──
     history = {
@@ -636,9 +790,9 @@ def generate_copilot_data():
             "Fix the failing test",
         ]
     }
-    with open(COPILOT_DIR / "command-history-state.json", "w") as f:
-        json.dump(history, f, indent=2)
-    print(f"  command-history-state.json ({len(history['commandHistory'])} entries)")
+    with open(COPILOT_DIR / "command-history-state.json", "wb", buffering=_BUFSZ) as f:
+        f.write(_dumps_indent(history))
+    progress.append(f"  command-history-state.json ({len(history['commandHistory'])} entries)")
 
     # ── Config ──
     config = {
@@ -646,21 +800,40 @@ def generate_copilot_data():
         "theme": "auto",
         "last_logged_in_user": {"host": "https://github.com", "login": "testuser"},
     }
-    with open(COPILOT_DIR / "config.json", "w") as f:
-        json.dump(config, f, indent=2)
-    print("  config.json")
+    with open(COPILOT_DIR / "config.json", "wb", buffering=_BUFSZ) as f:
+        f.write(_dumps_indent(config))
+    progress.append("  config.json")
+    sys.stdout.write("\n".join(progress) + "\n")
 
 
 # ─── main ─────────────────────────────────────────────────────────────
 
+# Regeneration is skipped when the generator itself is unchanged —
+# output is a pure function of this file, so its hash doubles as a
+# content stamp for everything it writes.
+_STAMP_FILE = Path("test/.fixtures-stamp")
+
+
 def main():
+    stamp = hashlib.blake2b(Path(__file__).read_bytes()).hexdigest()
+    if "--force" not in sys.argv[1:]:
+        try:
+            up_to_date = _STAMP_FILE.read_text() == stamp
+        except OSError:
+            up_to_date = False
+        if up_to_date and CLAUDE_DIR.is_dir() and COPILOT_DIR.is_dir():
+            print("Fixtures up to date; use --force to regenerate.")
+            return
+
     # Reset global RNG state
     global _uuid_counter
     _uuid_counter = 0
     _rng.seed(SEED)
+    _blob_rng.seed(SEED)
 
     generate_claude_data()
     generate_copilot_data()
+    _STAMP_FILE.write_text(stamp)
 
     print("\n✓ All test data generated successfully.")
     print(f"  Claude: {CLAUDE_DIR}")